@@ -4,6 +4,10 @@ import { db } from '../server/db';
 import { competitions } from '../shared/schema';
 import { eq, and, sql } from 'drizzle-orm';
 import { bucketStorage } from '../server/bucket-storage';
+import { createHash } from 'crypto';
+import * as fs from 'fs';
+import * as path from 'path';
+import { fileURLToPath } from 'url';
 
 interface SimplyCompeteEvent {
   id: string;
@@ -18,6 +22,14 @@ interface SimplyCompeteEvent {
   [key: string]: any;
 }
 
+interface CachedResponse {
+  url: string;
+  etag: string | null;
+  lastModified: string | null;
+  fetchedAt: number;
+  body: any;
+}
+
 interface SyncResult {
   total: number;
   matched: number;
@@ -30,6 +42,140 @@ interface SyncResult {
 
 const BASE_URL = 'https://worldtkd.simplycompete.com/events/eventList';
 const ITEMS_PER_PAGE = 50;
+const RETRY_STATUSES = [502, 503, 504];
+const MAX_RETRIES = 2;
+const RETRY_BACKOFF_MS = 300;
+// Resolved from this file, not the working directory, so every run shares one cache
+const CACHE_DIR = path.resolve(
+  path.dirname(fileURLToPath(import.meta.url)),
+  '..',
+  '.cache',
+  'simplycompete',
+);
+const CACHE_TTL_MS = 5 * 60 * 1000;
+
+// Request headers are built once per run; Node's global fetch dispatcher keeps the
+// connection to SimplyCompete alive between pages, so every call reuses the same socket.
+const REQUEST_HEADERS = buildRequestHeaders();
+
+function buildRequestHeaders(): Record<string, string> {
+  // Get authentication credentials from environment variables if available
+  const apiKey = process.env.SIMPLYCOMPETE_API_KEY;
+  const authToken = process.env.SIMPLYCOMPETE_AUTH_TOKEN;
+  const cookie = process.env.SIMPLYCOMPETE_COOKIE;
+
+  const headers: Record<string, string> = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://worldtkd.simplycompete.com/',
+    'Origin': 'https://worldtkd.simplycompete.com',
+  };
+
+  // Add authentication if available
+  if (apiKey) {
+    headers['X-API-Key'] = apiKey;
+  }
+  if (authToken) {
+    headers['Authorization'] = `Bearer ${authToken}`;
+  }
+  if (cookie) {
+    headers['Cookie'] = cookie;
+  }
+
+  return headers;
+}
+
+async function fetchWithRetry(url: string, extraHeaders: Record<string, string> = {}): Promise<Response> {
+  for (let attempt = 0; ; attempt++) {
+    const response = await fetch(url, { headers: { ...REQUEST_HEADERS, ...extraHeaders } });
+
+    // Retry transient gateway errors with exponential backoff (300ms, 600ms)
+    if (!RETRY_STATUSES.includes(response.status) || attempt >= MAX_RETRIES) {
+      return response;
+    }
+
+    const delay = RETRY_BACKOFF_MS * Math.pow(2, attempt);
+    console.log(`⏳ HTTP ${response.status} from SimplyCompete, retrying in ${delay}ms...`);
+    await response.body?.cancel();
+    await new Promise(resolve => setTimeout(resolve, delay));
+  }
+}
+
+function getCachePath(url: string): string {
+  const key = createHash('sha256').update(url).digest('hex');
+  return path.join(CACHE_DIR, `${key}.json`);
+}
+
+async function readCachedResponse(url: string): Promise<CachedResponse | null> {
+  try {
+    const cached: CachedResponse = JSON.parse(await fs.promises.readFile(getCachePath(url), 'utf8'));
+    return cached.url === url ? cached : null;
+  } catch {
+    return null;
+  }
+}
+
+async function writeCachedResponse(entry: CachedResponse): Promise<void> {
+  try {
+    await fs.promises.mkdir(CACHE_DIR, { recursive: true });
+    await fs.promises.writeFile(getCachePath(entry.url), JSON.stringify(entry));
+  } catch (error) {
+    // The cache is only an optimization; a failed write must not break the sync
+    console.warn(`⚠️  Could not write response cache:`, error instanceof Error ? error.message : error);
+  }
+}
+
+// Fetch JSON through an on-disk response cache keyed by the full request URL.
+// Cached pages are revalidated with ETag / Last-Modified when the server sent them
+// (a 304 reuses the stored body); otherwise they are reused for CACHE_TTL_MS.
+async function fetchJsonWithCache(url: string): Promise<any> {
+  const cached = await readCachedResponse(url);
+  const hasValidators = !!(cached?.etag || cached?.lastModified);
+
+  if (cached && !hasValidators && Date.now() - cached.fetchedAt < CACHE_TTL_MS) {
+    console.log(`💾 Using cached response (no validators, within TTL)`);
+    return cached.body;
+  }
+
+  const conditionalHeaders: Record<string, string> = {};
+  if (cached?.etag) {
+    conditionalHeaders['If-None-Match'] = cached.etag;
+  }
+  if (cached?.lastModified) {
+    conditionalHeaders['If-Modified-Since'] = cached.lastModified;
+  }
+
+  const response = await fetchWithRetry(url, conditionalHeaders);
+
+  if (response.status === 304 && cached) {
+    console.log(`💾 Not modified since last sync, using cached response`);
+    return cached.body;
+  }
+
+  if (!response.ok) {
+    if (response.status === 403) {
+      throw new Error(
+        'Authentication required. The SimplyCompete API requires authentication credentials.\n' +
+        'Please set one of the following environment variables:\n' +
+        '  - SIMPLYCOMPETE_API_KEY\n' +
+        '  - SIMPLYCOMPETE_AUTH_TOKEN\n' +
+        'Or contact SimplyCompete for API access credentials.'
+      );
+    }
+    throw new Error(`HTTP error! status: ${response.status} ${response.statusText}`);
+  }
+
+  const body = await response.json();
+  await writeCachedResponse({
+    url,
+    etag: response.headers.get('etag'),
+    lastModified: response.headers.get('last-modified'),
+    fetchedAt: Date.now(),
+    body,
+  });
+  return body;
+}
 
 async function fetchCompetitionsFromAPI(pageNumber: number = 1): Promise<SimplyCompeteEvent[]> {
   const params = new URLSearchParams({
@@ -44,47 +190,8 @@ async function fetchCompetitionsFromAPI(pageNumber: number = 1): Promise<SimplyC
   const url = `${BASE_URL}?${params.toString()}`;
   console.log(`📡 Fetching page ${pageNumber} from: ${url}`);
 
-  // Get authentication credentials from environment variables if available
-  const apiKey = process.env.SIMPLYCOMPETE_API_KEY;
-  const authToken = process.env.SIMPLYCOMPETE_AUTH_TOKEN;
-  const cookie = process.env.SIMPLYCOMPETE_COOKIE;
-
   try {
-    const headers: Record<string, string> = {
-      'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-      'Accept': 'application/json, text/plain, */*',
-      'Accept-Language': 'en-US,en;q=0.9',
-      'Referer': 'https://worldtkd.simplycompete.com/',
-      'Origin': 'https://worldtkd.simplycompete.com',
-    };
-
-    // Add authentication if available
-    if (apiKey) {
-      headers['X-API-Key'] = apiKey;
-    }
-    if (authToken) {
-      headers['Authorization'] = `Bearer ${authToken}`;
-    }
-    if (cookie) {
-      headers['Cookie'] = cookie;
-    }
-
-    const response = await fetch(url, { headers });
-    
-    if (!response.ok) {
-      if (response.status === 403) {
-        throw new Error(
-          'Authentication required. The SimplyCompete API requires authentication credentials.\n' +
-          'Please set one of the following environment variables:\n' +
-          '  - SIMPLYCOMPETE_API_KEY\n' +
-          '  - SIMPLYCOMPETE_AUTH_TOKEN\n' +
-          'Or contact SimplyCompete for API access credentials.'
-        );
-      }
-      throw new Error(`HTTP error! status: ${response.status} ${response.statusText}`);
-    }
-
-    const data = await response.json();
+    const data = await fetchJsonWithCache(url);
     
     // Extract events array from response (adjust based on actual API structure)
     const events = Array.isArray(data) ? data : data.events || data.data || [];
@@ -306,6 +413,11 @@ Authentication:
 
 API Endpoint:
   ${BASE_URL}
+
+Response Cache:
+  eventList pages are cached in ${CACHE_DIR}. Pages are revalidated with
+  ETag/Last-Modified when the server provides them, otherwise reused for
+  ${CACHE_TTL_MS / 60000} minutes. Delete the directory to force a full refresh.
     `);
     process.exit(0);
   }
@@ -29,7 +29,7 @@ import {
 import { setupAuth, isAuthenticated } from "./replitAuth";
 import { db } from "./db";
 import * as schema from "../shared/schema";
-import { eq, desc, sql, and } from "drizzle-orm";
+import { eq, desc, sql, and, inArray } from "drizzle-orm";
 import multer from "multer";
 import { geminiVideoAnalysis, videoAnalysisProgressSSE, setAnalysisComplete } from "./gemini-video-analysis";
 import { randomUUID } from "crypto";
@@ -39,6 +39,7 @@ import { exec } from "child_process";
 import { promisify } from "util";
 import puppeteer from "puppeteer-extra";
 import StealthPlugin from "puppeteer-extra-plugin-stealth";
+import type { Browser } from "puppeteer";
 
 export async function registerRoutes(app: Express): Promise<Server> {
   // Health check endpoint for deployment - use /api/health instead of / to not interfere with static files
@@ -1135,8 +1136,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
       // Fetch all pages using the new eventList endpoint (starts from pageNumber=1)
       let pageNumber = 1;
       while (hasMorePages) {
-        console.log(`📄 Fetching page ${pageNumber}...`);
-
         const requestHeaders = {
           Accept: "application/json, text/plain, */*",
           "Accept-Encoding": "gzip, deflate, br, zstd",
@@ -1158,11 +1157,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
           "X-Requested-With": "XMLHttpRequest",
         };
 
-        console.log(
-          "📤 Request headers set with cookie length:",
-          requestHeaders.Cookie.length,
-        );
-
         const response = await fetch(
           `https://worldtkd.simplycompete.com/events/eventList?da=true&eventType=All&invitationStatus=all&isArchived=false&itemsPerPage=12&pageNumber=${pageNumber}`,
           {
@@ -1185,10 +1179,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
         }
 
         const responseData = await response.json();
-        console.log(
-          `📄 Page ${pageNumber}: Response structure:`,
-          Object.keys(responseData),
-        );
 
         // Extract events from the response (format may be different)
         const events =
@@ -1216,11 +1206,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       console.log(`🏆 Total competitions scraped: ${allCompetitions.length}`);
 
-      // Save raw events to file
-      const fs = require("fs");
-      fs.writeFileSync(
+      // Save raw events to file without blocking the event loop. The raw dump can be
+      // large, so it is written compact; the summary below stays pretty-printed.
+      await fs.promises.writeFile(
         "events_raw.json",
-        JSON.stringify(allCompetitions, null, 2),
+        JSON.stringify(allCompetitions),
       );
       console.log("💾 Saved events_raw.json");
 
@@ -1343,7 +1333,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         totalVerified: verifiedEvents.filter((e) => e.verified).length,
         events: verifiedEvents,
       };
-      fs.writeFileSync(
+      await fs.promises.writeFile(
         "events_summary.json",
         JSON.stringify(summaryData, null, 2),
       );
@@ -1522,12 +1512,16 @@ export async function registerRoutes(app: Express): Promise<Server> {
         pointsAvailable: comp.pointsAvailable,
       }));
 
-      console.log("\n=== STORED UPCOMING COMPETITIONS ===");
-      eventList.forEach((item, index) => {
-        console.log(`${index + 1}. ${item.name} - Event ID: ${item.eventId}`);
-      });
+      // Build the listing once and write it with a single console call
+      const listingLines = eventList.map(
+        (item, index) => `${index + 1}. ${item.name} - Event ID: ${item.eventId}`,
+      );
       console.log(
-        `\nTotal: ${eventList.length} upcoming competitions in database`,
+        [
+          "\n=== STORED UPCOMING COMPETITIONS ===",
+          ...listingLines,
+          `\nTotal: ${eventList.length} upcoming competitions in database`,
+        ].join("\n"),
       );
 
       res.json({
@@ -1733,6 +1727,28 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Realistic browser headers to bypass basic Cloudflare protection. Built once and
+  // shared by every SimplyCompete API call; Node's fetch keeps the connection alive
+  // between requests, so paginated and parallel fetches reuse pooled sockets.
+  const SIMPLYCOMPETE_API_HEADERS = {
+    Accept: "application/json, text/plain, */*",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    Pragma: "no-cache",
+    Priority: "u=1, i",
+    Referer: "https://worldtkd.simplycompete.com/events",
+    "Sec-Ch-Ua":
+      '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "User-Agent":
+      "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+  };
+
   // Helper function to fetch athlete role node_id from eventHierarchy
   async function getAthleteNodeId(eventId: string): Promise<string | null> {
     try {
@@ -1741,26 +1757,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         `🔍 Fetching event hierarchy to get athlete role node_id: ${url}`,
       );
 
-      const headers = {
-        Accept: "application/json, text/plain, */*",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        Pragma: "no-cache",
-        Priority: "u=1, i",
-        Referer: "https://worldtkd.simplycompete.com/events",
-        "Sec-Ch-Ua":
-          '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-        "Sec-Ch-Ua-Mobile": "?0",
-        "Sec-Ch-Ua-Platform": '"Windows"',
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-origin",
-        "User-Agent":
-          "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-      };
-
-      const response = await fetch(url, { headers });
+      const response = await fetch(url, { headers: SIMPLYCOMPETE_API_HEADERS });
 
       if (!response.ok) {
         console.error(
@@ -1796,166 +1793,262 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   }
 
-  // Function to fetch all participants from SimplyCompete API with pagination
-  async function fetchAllSimplyCompeteParticipants(
+  // Participant pages requested per round-trip once pagination goes past the first page
+  const PARTICIPANT_PAGE_WINDOW = 8;
+  const PARTICIPANTS_PER_PAGE = 4000;
+
+  // Fetch a single page of participants, retrying once. Returns null when the page
+  // could not be fetched or the response has no participant list. With
+  // retryIfBlocked off, a Cloudflare 403 returns null at once instead of retrying.
+  async function fetchSimplyCompeteParticipantPage(
     eventId: string,
+    pageNo: number,
     nodeId?: string,
-  ) {
-    const allParticipants: any[] = [];
-    let pageNo = 0;
-    let hasMorePages = true;
+    retryIfBlocked = true,
+  ): Promise<any[] | null> {
+    let lastError: any = null;
 
-    while (hasMorePages) {
-      let fetchSuccess = false;
-      let lastError: any = null;
+    // Retry logic: try twice for each page
+    for (let attempt = 1; attempt <= 2; attempt++) {
+      try {
+        let url = `https://worldtkd.simplycompete.com/events/getEventParticipant?eventId=${eventId}&isHideUnpaidEntries=false&nodeLevel=EventRole&pageNo=${pageNo}&itemsPerPage=${PARTICIPANTS_PER_PAGE}`;
+        if (nodeId) {
+          url += `&nodeId=${nodeId}`;
+        }
 
-      // Retry logic: try twice for each page
-      for (let attempt = 1; attempt <= 2; attempt++) {
-        try {
-          let url = `https://worldtkd.simplycompete.com/events/getEventParticipant?eventId=${eventId}&isHideUnpaidEntries=false&nodeLevel=EventRole&pageNo=${pageNo}&itemsPerPage=4000`;
-          if (nodeId) {
-            url += `&nodeId=${nodeId}`;
-          }
+        const response = await fetch(url, {
+          headers: SIMPLYCOMPETE_API_HEADERS,
+        });
 
-          console.log(
-            `📡 Fetching participants from: ${url} (attempt ${attempt}/2)`,
+        if (!response.ok) {
+          console.error(
+            `Failed to fetch page ${pageNo} (attempt ${attempt}/2):`,
+            response.status,
+            response.statusText,
           );
-
-          // Use realistic browser headers to bypass basic Cloudflare protection
-          const headers = {
-            Accept: "application/json, text/plain, */*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Cache-Control": "no-cache",
-            Pragma: "no-cache",
-            Priority: "u=1, i",
-            Referer: "https://worldtkd.simplycompete.com/events",
-            "Sec-Ch-Ua":
-              '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-origin",
-            "User-Agent":
-              "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-          };
-
-          const response = await fetch(url, { headers });
-
-          if (!response.ok) {
+          if (response.status === 403) {
             console.error(
-              `Failed to fetch page ${pageNo} (attempt ${attempt}/2):`,
-              response.status,
-              response.statusText,
+              "❌ Cloudflare blocked the request. This endpoint requires browser-based access.",
             );
-            if (response.status === 403) {
-              console.error(
-                "❌ Cloudflare blocked the request. This endpoint requires browser-based access.",
-              );
-              throw new Error(
-                "Cloudflare protection detected. Cannot fetch participants via server-side requests.",
-              );
+            if (!retryIfBlocked) {
+              return null;
             }
-            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            throw new Error(
+              "Cloudflare protection detected. Cannot fetch participants via server-side requests.",
+            );
           }
+          throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
 
-          const data = await response.json();
+        const data = await response.json();
 
-          if (
-            data.data?.data?.participantList &&
-            Array.isArray(data.data.data.participantList)
-          ) {
-            const participants = data.data.data.participantList;
+        if (
+          data.data?.data?.participantList &&
+          Array.isArray(data.data.data.participantList)
+        ) {
+          return data.data.data.participantList;
+        }
+        return null;
+      } catch (error) {
+        lastError = error;
+        console.error(
+          `❌ Fetch attempt ${attempt} failed for page ${pageNo}:`,
+          error,
+        );
 
-            if (participants.length === 0) {
-              hasMorePages = false;
-            } else {
-              allParticipants.push(...participants);
-              pageNo++;
+        if (attempt < 2) {
+          console.log(`⏳ Retrying in 1 second...`);
+          await new Promise((resolve) => setTimeout(resolve, 1000));
+        }
+      }
+    }
 
-              // Safety check to prevent infinite loops
-              if (pageNo > 100) {
-                console.warn("Reached maximum page limit (100)");
-                break;
-              }
-            }
-          } else {
-            hasMorePages = false;
-          }
+    console.error(`Failed to fetch page ${pageNo} after 2 attempts:`, lastError);
+    return null;
+  }
 
-          fetchSuccess = true;
-          break; // Success - exit retry loop
-        } catch (error) {
-          lastError = error;
-          console.error(
-            `❌ Fetch attempt ${attempt} failed for page ${pageNo}:`,
-            error,
-          );
+  // Function to fetch all participants from SimplyCompete API with pagination.
+  // Pages 0 and 1 are fetched one at a time: nearly every event fits on page 0, so
+  // an empty page 1 ends pagination after two requests. A non-empty page 1 means the
+  // server caps the page size (page 0's length), and the remaining pages are then
+  // requested in parallel windows until an empty (or failed) page is reached.
+  async function fetchAllSimplyCompeteParticipants(
+    eventId: string,
+    nodeId?: string,
+    retryIfBlocked = true,
+  ) {
+    const allParticipants: any[] = [];
 
-          if (attempt < 2) {
-            console.log(`⏳ Retrying in 1 second...`);
-            await new Promise((resolve) => setTimeout(resolve, 1000));
-          }
+    console.log(`📡 Fetching participant page 0 for event ${eventId}`);
+    const firstPage = await fetchSimplyCompeteParticipantPage(
+      eventId,
+      0,
+      nodeId,
+      retryIfBlocked,
+    );
+    if (!firstPage || firstPage.length === 0) {
+      return allParticipants;
+    }
+    allParticipants.push(...firstPage);
+
+    console.log(`📡 Fetching participant page 1 for event ${eventId}`);
+    const secondPage = await fetchSimplyCompeteParticipantPage(
+      eventId,
+      1,
+      nodeId,
+      retryIfBlocked,
+    );
+    if (!secondPage || secondPage.length === 0) {
+      return allParticipants;
+    }
+    allParticipants.push(...secondPage);
+
+    // Page 0 was full, so its length is the server's real page size; a shorter
+    // page 1 is the last one
+    const pageSize = firstPage.length;
+    if (secondPage.length < pageSize) {
+      return allParticipants;
+    }
+    console.log(
+      `📄 SimplyCompete caps participant pages at ${pageSize} rows, fetching the rest in parallel`,
+    );
+
+    let pageNo = 2;
+    while (pageNo <= 100) {
+      const windowEnd = Math.min(pageNo + PARTICIPANT_PAGE_WINDOW, 101);
+      const pageNumbers = Array.from(
+        { length: windowEnd - pageNo },
+        (_, i) => pageNo + i,
+      );
+
+      console.log(
+        `📡 Fetching participant pages ${pageNo}-${windowEnd - 1} for event ${eventId}`,
+      );
+
+      const pages = await Promise.all(
+        pageNumbers.map((page) =>
+          fetchSimplyCompeteParticipantPage(
+            eventId,
+            page,
+            nodeId,
+            retryIfBlocked,
+          ),
+        ),
+      );
+
+      // Keep pages in order and stop at the first empty or failed one
+      for (const participants of pages) {
+        if (!participants || participants.length === 0) {
+          return allParticipants;
         }
+        allParticipants.push(...participants);
       }
 
-      // If both attempts failed, stop pagination
-      if (!fetchSuccess) {
-        console.error(
-          `Failed to fetch page ${pageNo} after 2 attempts:`,
-          lastError,
-        );
-        hasMorePages = false;
-      }
+      pageNo = windowEnd;
     }
 
+    // Safety check to prevent infinite loops
+    console.warn("Reached maximum page limit (100)");
     return allParticipants;
   }
 
-  // Helper function to group participants by weight category
-  function groupParticipants(participantList: any[]) {
-    // Filter for Senior Division athletes only
-    const seniorAthletes = participantList.filter(
-      (participant) =>
-        !participant.subeventName ||
-        participant.subeventName === "Senior Division",
+  // Athlete role node IDs resolved by earlier plain-HTTP requests, keyed by
+  // SimplyCompete event ID. Only that path can reuse them, so the stealth browser
+  // never writes here.
+  const athleteNodeIdCache = new Map<string, string>();
+
+  // Fetch the athlete participants of an event over plain HTTP. When the athlete
+  // node_id is already known, the participant fetch starts right away with it while
+  // the event hierarchy is re-read in parallel; participants are only fetched again
+  // if the node_id changed. A Cloudflare block on the speculative fetch is never
+  // retried; callers with a stealth-browser fallback pass retryIfBlocked = false so
+  // a block on the regular fetch isn't retried either.
+  async function fetchAthleteParticipants(
+    eventId: string,
+    retryIfBlocked = true,
+  ): Promise<{ nodeId: string | null; participants: any[] }> {
+    const cachedNodeId = athleteNodeIdCache.get(eventId);
+    const nodeIdPromise = getAthleteNodeId(eventId);
+
+    if (cachedNodeId) {
+      const [nodeId, participants] = await Promise.all([
+        nodeIdPromise,
+        fetchAllSimplyCompeteParticipants(eventId, cachedNodeId, false),
+      ]);
+
+      if (nodeId === cachedNodeId) {
+        return { nodeId, participants };
+      }
+
+      // The hierarchy could not be re-read (e.g. blocked): keep the speculative
+      // result if the cached node_id still worked, otherwise report the failure
+      if (!nodeId) {
+        return participants.length > 0
+          ? { nodeId: cachedNodeId, participants }
+          : { nodeId: null, participants: [] };
+      }
+
+      console.log(
+        `🔄 Athlete node_id for event ${eventId} changed (${cachedNodeId} → ${nodeId}), re-fetching participants`,
+      );
+    }
+
+    const nodeId = await nodeIdPromise;
+    if (!nodeId) {
+      return { nodeId: null, participants: [] };
+    }
+
+    athleteNodeIdCache.set(eventId, nodeId);
+    const participants = await fetchAllSimplyCompeteParticipants(
+      eventId,
+      nodeId,
+      retryIfBlocked,
     );
+    return { nodeId, participants };
+  }
 
-    // Group by weight category
-    const groupedByWeight = seniorAthletes.reduce(
-      (acc: any, participant: any) => {
-        const weightCategory = participant.divisionName || "No Weight Category";
+  // Helper function to group participants by weight category
+  function groupParticipants(participantList: any[]) {
+    // Group Senior Division athletes by weight category in a single pass
+    const groupedByWeight = new Map<
+      string,
+      { weightCategory: string; athleteCount: number; athletes: any[] }
+    >();
 
-        if (!acc[weightCategory]) {
-          acc[weightCategory] = {
-            weightCategory: weightCategory,
-            athleteCount: 0,
-            athletes: [],
-          };
-        }
+    for (const participant of participantList) {
+      if (
+        participant.subeventName &&
+        participant.subeventName !== "Senior Division"
+      ) {
+        continue;
+      }
 
-        const athleteData = {
-          name: `${participant.preferredFirstName || ""} ${participant.preferredLastName || ""}`.trim(),
-          license: participant.wtfLicenseId || "",
-          country: participant.country || "",
-          club: participant.clubName || participant.customClubName || "",
-          avatar: participant.avatar || "",
-          organization: participant.teamOrganizationName || "",
-          division: participant.subeventName || "",
-          team: participant.teamName || "",
-        };
+      const weightCategory = participant.divisionName || "No Weight Category";
 
-        acc[weightCategory].athletes.push(athleteData);
-        acc[weightCategory].athleteCount = acc[weightCategory].athletes.length;
+      let group = groupedByWeight.get(weightCategory);
+      if (!group) {
+        group = { weightCategory, athleteCount: 0, athletes: [] };
+        groupedByWeight.set(weightCategory, group);
+      }
 
-        return acc;
-      },
-      {},
-    );
+      group.athletes.push({
+        name: `${participant.preferredFirstName || ""} ${participant.preferredLastName || ""}`.trim(),
+        license: participant.wtfLicenseId || "",
+        country: participant.country || "",
+        club: participant.clubName || participant.customClubName || "",
+        avatar: participant.avatar || "",
+        organization: participant.teamOrganizationName || "",
+        division: participant.subeventName || "",
+        team: participant.teamName || "",
+      });
+    }
 
-    // Convert to array format and sort by weight category
-    return Object.values(groupedByWeight).sort((a: any, b: any) =>
+    // Convert to array format, fill in counts once and sort by weight category
+    const groups = Array.from(groupedByWeight.values());
+    for (const group of groups) {
+      group.athleteCount = group.athletes.length;
+    }
+    return groups.sort((a, b) =>
       a.weightCategory.localeCompare(b.weightCategory),
     );
   }
@@ -1982,8 +2075,9 @@ export async function registerRoutes(app: Express): Promise<Server> {
           `Fetching participants for ${competition.name} from SimplyCompete API...`,
         );
 
-        // Get athlete role node_id from eventHierarchy
-        const athleteNodeId = await getAthleteNodeId(simplyCompeteEventId);
+        // Get athlete role node_id from eventHierarchy and fetch its participants
+        const { nodeId: athleteNodeId, participants } =
+          await fetchAthleteParticipants(simplyCompeteEventId);
 
         if (!athleteNodeId) {
           return res.status(500).json({
@@ -1991,10 +2085,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
           });
         }
 
-        const participants = await fetchAllSimplyCompeteParticipants(
-          simplyCompeteEventId,
-          athleteNodeId,
-        );
         return res.json(groupParticipants(participants));
       }
 
@@ -2192,423 +2282,533 @@ export async function registerRoutes(app: Express): Promise<Server> {
     },
   );
 
-  // Sync participants from SimplyCompete using stealth browser (bypasses Cloudflare like Python cloudscraper)
-  app.post("/api/competitions/:id/sync-participants", async (req, res) => {
-    try {
-      const competitionId = parseInt(req.params.id);
+  // The stealth browser is launched on demand and shared by concurrent participant
+  // syncs, then closed after a few idle minutes so Chromium doesn't stay resident.
+  // It runs with a persistent profile directory, so Cloudflare clearance cookies
+  // survive relaunches (and server restarts) and the challenge is usually skipped.
+  const STEALTH_BROWSER_PROFILE_DIR = ".puppeteer_profile";
+  const STEALTH_BROWSER_IDLE_MS = 5 * 60 * 1000;
+  let chromiumPathPromise: Promise<string> | null = null;
+  let stealthBrowserPromise: Promise<Browser> | null = null;
+  let stealthBrowserOpenPages = 0;
+  let stealthBrowserIdleTimer: NodeJS.Timeout | null = null;
+  let stealthBrowserClosing: Promise<void> = Promise.resolve();
+
+  // Find system Chromium path (Nix-provided)
+  function resolveChromiumPath(): Promise<string> {
+    if (!chromiumPathPromise) {
+      const execAsync = promisify(exec);
+      chromiumPathPromise = execAsync("which chromium").then(
+        ({ stdout }) => stdout.trim(),
+        () => {
+          chromiumPathPromise = null;
+          throw new Error(
+            "Chromium not found. Please ensure it is installed via Nix.",
+          );
+        },
+      );
+    }
+    return chromiumPathPromise;
+  }
 
-      if (isNaN(competitionId)) {
-        return res.status(400).json({ error: "Invalid competition ID" });
-      }
+  function getStealthBrowser(): Promise<Browser> {
+    if (!stealthBrowserPromise) {
+      // Wait for an idle browser to finish closing; both share the profile directory
+      const launched: Promise<Browser> = stealthBrowserClosing
+        .then(() => resolveChromiumPath())
+        .then((chromiumPath) => {
+          console.log(`📍 Using system Chromium at: ${chromiumPath}`);
+
+          // Launch stealth browser (JavaScript equivalent of Python cloudscraper)
+          return puppeteer.launch({
+            headless: true,
+            executablePath: chromiumPath,
+            userDataDir: STEALTH_BROWSER_PROFILE_DIR,
+            args: [
+              "--no-sandbox",
+              "--disable-setuid-sandbox",
+              "--disable-dev-shm-usage",
+              "--disable-accelerated-2d-canvas",
+              "--disable-gpu",
+              "--disable-extensions",
+            ],
+          });
+        })
+        .then((browser) => {
+          // Relaunch on next use if Chromium crashes or is closed
+          browser.on("disconnected", () => {
+            if (stealthBrowserPromise === launched) {
+              stealthBrowserPromise = null;
+            }
+          });
+          return browser;
+        });
+      launched.catch(() => {
+        if (stealthBrowserPromise === launched) {
+          stealthBrowserPromise = null;
+        }
+      });
+      stealthBrowserPromise = launched;
+    }
+    return stealthBrowserPromise;
+  }
 
-      // Get the competition from the database
-      const competition = await storage.getCompetition(competitionId);
-      if (!competition) {
-        return res.status(404).json({ error: "Competition not found" });
+  // Close the shared browser once no page has been open for STEALTH_BROWSER_IDLE_MS
+  function scheduleStealthBrowserIdleClose() {
+    if (stealthBrowserIdleTimer) {
+      clearTimeout(stealthBrowserIdleTimer);
+    }
+    stealthBrowserIdleTimer = setTimeout(() => {
+      stealthBrowserIdleTimer = null;
+      const browserPromise = stealthBrowserPromise;
+      if (!browserPromise || stealthBrowserOpenPages > 0) {
+        return;
       }
 
-      const simplyCompeteEventId = (competition as any).simplyCompeteEventId;
-      if (!simplyCompeteEventId) {
-        return res.status(400).json({
-          error: "This competition doesn't have a SimplyCompete event ID",
-        });
-      }
+      // Detach first so a sync starting now launches a fresh browser
+      stealthBrowserPromise = null;
+      console.log("💤 Closing idle stealth browser");
+      stealthBrowserClosing = browserPromise
+        .then((browser) => browser.close())
+        .catch((error) =>
+          console.error("Failed to close idle stealth browser:", error),
+        );
+    }, STEALTH_BROWSER_IDLE_MS);
+  }
 
-      console.log(
-        `🚀 Using stealth browser to bypass Cloudflare (like Python cloudscraper)...`,
-      );
+  // Load a URL in a fresh tab of the shared stealth browser and return the page text
+  async function fetchWithStealthBrowser(url: string): Promise<string | null> {
+    stealthBrowserOpenPages++;
+    if (stealthBrowserIdleTimer) {
+      clearTimeout(stealthBrowserIdleTimer);
+      stealthBrowserIdleTimer = null;
+    }
 
-      // Find system Chromium path (Nix-provided)
-      const execAsync = promisify(exec);
+    try {
+      const browser = await getStealthBrowser();
+      const page = await browser.newPage();
 
-      let chromiumPath: string;
       try {
-        const { stdout } = await execAsync("which chromium");
-        chromiumPath = stdout.trim();
-        console.log(`📍 Using system Chromium at: ${chromiumPath}`);
-      } catch (error) {
-        throw new Error(
-          "Chromium not found. Please ensure it is installed via Nix.",
-        );
-      }
+        // Set extra headers to appear more like a real browser
+        await page.setExtraHTTPHeaders({
+          'Accept-Language': 'en-US,en;q=0.9',
+          'Accept': 'application/json, text/plain, */*',
+          'Cache-Control': 'no-cache',
+          'Pragma': 'no-cache',
+        });
 
-      // Launch stealth browser (JavaScript equivalent of Python cloudscraper)
-      const browser = await puppeteer.launch({
-        headless: true,
-        executablePath: chromiumPath,
-        args: [
-          "--no-sandbox",
-          "--disable-setuid-sandbox",
-          "--disable-dev-shm-usage",
-          "--disable-accelerated-2d-canvas",
-          "--disable-gpu",
-        ],
-      });
+        // Set realistic viewport and user agent
+        await page.setViewport({ width: 1920, height: 1080 });
+        await page.setUserAgent(
+          "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        );
 
-      try {
-        // Step 1: Fetch eventHierarchy with stealth browser to get athlete role node_id
-        let athleteNodeId: string | null = null;
-        let hierarchyError: Error | null = null;
+        // Navigate and wait for network to be idle
+        await page.goto(url, {
+          waitUntil: "networkidle0",
+          timeout: 45000,
+        });
 
-        for (let attempt = 1; attempt <= 2; attempt++) {
-          try {
-            const hierarchyUrl = `https://worldtkd.simplycompete.com/events/eventHierarchy?eventId=${simplyCompeteEventId}`;
-            
-            console.log(
-              `🔍 Fetching event hierarchy with stealth browser (attempt ${attempt}/2): ${hierarchyUrl}`,
-            );
+        // Wait a bit more for any dynamic content to load
+        await new Promise(resolve => setTimeout(resolve, 2000));
 
-            const hierarchyPage = await browser.newPage();
-            
-            // Set extra headers to appear more like a real browser
-            await hierarchyPage.setExtraHTTPHeaders({
-              'Accept-Language': 'en-US,en;q=0.9',
-              'Accept': 'application/json, text/plain, */*',
-              'Cache-Control': 'no-cache',
-              'Pragma': 'no-cache',
-            });
-            
-            await hierarchyPage.setViewport({ width: 1920, height: 1080 });
-            await hierarchyPage.setUserAgent(
-              "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            );
-
-            // Navigate and wait for network to be idle
-            await hierarchyPage.goto(hierarchyUrl, {
-              waitUntil: "networkidle0",
-              timeout: 45000,
-            });
+        return await page.evaluate(() => document.body.textContent);
+      } finally {
+        await page.close();
+      }
+    } finally {
+      stealthBrowserOpenPages--;
+      if (stealthBrowserOpenPages === 0) {
+        scheduleStealthBrowserIdleClose();
+      }
+    }
+  }
 
-            // Wait a bit more for any dynamic content to load
-            await new Promise(resolve => setTimeout(resolve, 2000));
+  // Fetch athlete participants for an event through the stealth browser. This is the
+  // slow path (Chromium + Cloudflare challenge) and is only used when a plain request fails.
+  async function fetchParticipantsWithStealthBrowser(
+    simplyCompeteEventId: string,
+  ): Promise<any[]> {
+    console.log(
+      `🚀 Using stealth browser to bypass Cloudflare (like Python cloudscraper)...`,
+    );
 
-            const hierarchyContent = await hierarchyPage.evaluate(() => document.body.textContent);
-            await hierarchyPage.close();
-            
-            // Check if we got a valid JSON response
-            if (!hierarchyContent || hierarchyContent.trim().startsWith('<') || hierarchyContent.includes('Please enable')) {
-              throw new Error("Received HTML/challenge page instead of JSON from Cloudflare");
-            }
+    // Step 1: Fetch eventHierarchy with stealth browser to get athlete role node_id
+    let athleteNodeId: string | null = null;
+    let hierarchyError: Error | null = null;
 
-            if (!hierarchyContent) {
-              throw new Error("Empty response from eventHierarchy");
-            }
+    for (let attempt = 1; attempt <= 2; attempt++) {
+      try {
+        const hierarchyUrl = `https://worldtkd.simplycompete.com/events/eventHierarchy?eventId=${simplyCompeteEventId}`;
+        
+        console.log(
+          `🔍 Fetching event hierarchy with stealth browser (attempt ${attempt}/2): ${hierarchyUrl}`,
+        );
 
-            // Parse the hierarchy response
-            const hierarchyData = JSON.parse(hierarchyContent);
-            
-            console.log(`📋 Hierarchy data structure: ${JSON.stringify(hierarchyData).substring(0, 300)}`);
-            
-            // Find athlete role node_id in data.children array
-            if (hierarchyData?.data?.children && Array.isArray(hierarchyData.data.children)) {
-              const athleteRole = hierarchyData.data.children.find((role: any) => 
-                role.nameOfNode?.toLowerCase() === 'athlete' || 
-                role.nameOfNode?.toLowerCase() === 'athletes'
-              );
+        const hierarchyContent = await fetchWithStealthBrowser(hierarchyUrl);
+        
+        // Check if we got a valid JSON response
+        if (!hierarchyContent || hierarchyContent.trim().startsWith('<') || hierarchyContent.includes('Please enable')) {
+          throw new Error("Received HTML/challenge page instead of JSON from Cloudflare");
+        }
 
-              if (athleteRole && athleteRole.nodeId) {
-                athleteNodeId = athleteRole.nodeId;
-                console.log(`✅ Found athlete role node_id: ${athleteNodeId} (participantCount: ${athleteRole.participantCount})`);
-                hierarchyError = null;
-                break;
-              } else {
-                console.log(`⚠️ Available roles: ${hierarchyData.data.children.map((r: any) => r.nameOfNode).join(', ')}`);
-              }
-            }
+        if (!hierarchyContent) {
+          throw new Error("Empty response from eventHierarchy");
+        }
 
-            throw new Error("Could not find athlete role in event hierarchy");
-          } catch (error: any) {
-            hierarchyError = error;
-            console.error(`❌ Hierarchy fetch attempt ${attempt} failed:`, error.message);
+        // Parse the hierarchy response
+        const hierarchyData = JSON.parse(hierarchyContent);
+        
+        console.log(`📋 Hierarchy data structure: ${hierarchyContent.substring(0, 300)}`);
+        
+        // Find athlete role node_id in data.children array
+        if (hierarchyData?.data?.children && Array.isArray(hierarchyData.data.children)) {
+          const athleteRole = hierarchyData.data.children.find((role: any) => 
+            role.nameOfNode?.toLowerCase() === 'athlete' || 
+            role.nameOfNode?.toLowerCase() === 'athletes'
+          );
 
-            if (attempt < 2) {
-              console.log(`⏳ Retrying hierarchy fetch in 2 seconds...`);
-              await new Promise((resolve) => setTimeout(resolve, 2000));
-            }
+          if (athleteRole && athleteRole.nodeId) {
+            athleteNodeId = athleteRole.nodeId;
+            console.log(`✅ Found athlete role node_id: ${athleteNodeId} (participantCount: ${athleteRole.participantCount})`);
+            hierarchyError = null;
+            break;
+          } else {
+            console.log(`⚠️ Available roles: ${hierarchyData.data.children.map((r: any) => r.nameOfNode).join(', ')}`);
           }
         }
 
-        if (hierarchyError || !athleteNodeId) {
-          await browser.close();
-          return res.status(500).json({
-            error: "Failed to fetch athlete role node_id from event hierarchy. Cannot proceed with sync.",
-          });
+        throw new Error("Could not find athlete role in event hierarchy");
+      } catch (error: any) {
+        hierarchyError = error;
+        console.error(`❌ Hierarchy fetch attempt ${attempt} failed:`, error.message);
+
+        if (attempt < 2) {
+          console.log(`⏳ Retrying hierarchy fetch in 2 seconds...`);
+          await new Promise((resolve) => setTimeout(resolve, 2000));
         }
+      }
+    }
 
-        // Step 2: Fetch participants filtered by athlete node_id
-        let textContent: string | null = null;
-        let fetchError: Error | null = null;
+    if (hierarchyError || !athleteNodeId) {
+      throw new Error(
+        "Failed to fetch athlete role node_id from event hierarchy. Cannot proceed with sync.",
+      );
+    }
 
-        for (let attempt = 1; attempt <= 2; attempt++) {
-          try {
-            const url = `https://worldtkd.simplycompete.com/events/getEventParticipant?eventId=${simplyCompeteEventId}&isHideUnpaidEntries=false&nodeId=${athleteNodeId}&nodeLevel=EventRole&pageNo=0&itemsPerPage=4000`;
+    // Step 2: Fetch participants filtered by athlete node_id
+    let textContent: string | null = null;
+    let fetchError: Error | null = null;
 
-            console.log(
-              `📡 Fetching participants with stealth browser (attempt ${attempt}/2): ${url}`,
-            );
+    for (let attempt = 1; attempt <= 2; attempt++) {
+      try {
+        const url = `https://worldtkd.simplycompete.com/events/getEventParticipant?eventId=${simplyCompeteEventId}&isHideUnpaidEntries=false&nodeId=${athleteNodeId}&nodeLevel=EventRole&pageNo=0&itemsPerPage=4000`;
 
-            const page = await browser.newPage();
+        console.log(
+          `📡 Fetching participants with stealth browser (attempt ${attempt}/2): ${url}`,
+        );
 
-            // Set extra headers to appear more like a real browser
-            await page.setExtraHTTPHeaders({
-              'Accept-Language': 'en-US,en;q=0.9',
-              'Accept': 'application/json, text/plain, */*',
-              'Cache-Control': 'no-cache',
-              'Pragma': 'no-cache',
-            });
+        textContent = await fetchWithStealthBrowser(url);
 
-            // Set realistic viewport and user agent
-            await page.setViewport({ width: 1920, height: 1080 });
-            await page.setUserAgent(
-              "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            );
+        if (!textContent) {
+          throw new Error("Empty response from SimplyCompete");
+        }
 
-            // Navigate and wait for response
-            await page.goto(url, {
-              waitUntil: "networkidle0",
-              timeout: 45000,
-            });
+        // Log the raw response for debugging
+        console.log(
+          `📄 Raw response (first 500 chars): ${textContent.substring(0, 500)}`,
+        );
+
+        // Check if response looks like JSON
+        if (
+          !textContent.trim().startsWith("{") &&
+          !textContent.trim().startsWith("[")
+        ) {
+          console.error(
+            `❌ Response is not JSON. Got HTML or text instead. Full response: ${textContent.substring(0, 1000)}`,
+          );
+          throw new Error(
+            "Received non-JSON response from SimplyCompete - possibly a Cloudflare challenge page",
+          );
+        }
 
-            // Wait a bit more for any dynamic content to load
-            await new Promise(resolve => setTimeout(resolve, 2000));
+        // Success - break out of retry loop
+        fetchError = null;
+        break;
+      } catch (error: any) {
+        fetchError = error;
+        console.error(`❌ Fetch attempt ${attempt} failed:`, error.message);
 
-            // Extract JSON from page
-            textContent = await page.evaluate(() => document.body.textContent);
-            await page.close();
+        if (attempt < 2) {
+          console.log(`⏳ Retrying fetch in 2 seconds...`);
+          await new Promise((resolve) => setTimeout(resolve, 2000));
+        }
+      }
+    }
 
-            if (!textContent) {
-              throw new Error("Empty response from SimplyCompete");
-            }
+    // If both attempts failed, throw the error
+    if (fetchError || !textContent) {
+      throw (
+        fetchError ||
+        new Error("Failed to fetch participants after 2 attempts")
+      );
+    }
 
-            // Log the raw response for debugging
-            console.log(
-              `📄 Raw response (first 500 chars): ${textContent.substring(0, 500)}`,
-            );
+    const data = JSON.parse(textContent);
 
-            // Check if response looks like JSON
-            if (
-              !textContent.trim().startsWith("{") &&
-              !textContent.trim().startsWith("[")
-            ) {
-              console.error(
-                `❌ Response is not JSON. Got HTML or text instead. Full response: ${textContent.substring(0, 1000)}`,
-              );
-              throw new Error(
-                "Received non-JSON response from SimplyCompete - possibly a Cloudflare challenge page",
-              );
-            }
+    if (
+      !data.data?.data?.participantList ||
+      !Array.isArray(data.data.data.participantList)
+    ) {
+      throw new Error("Invalid response format from SimplyCompete");
+    }
 
-            // Success - break out of retry loop
-            fetchError = null;
-            break;
-          } catch (error: any) {
-            fetchError = error;
-            console.error(`❌ Fetch attempt ${attempt} failed:`, error.message);
+    const participants = data.data.data.participantList;
+    console.log(
+      `✅ Successfully fetched ${participants.length} participants using stealth browser`,
+    );
+    return participants;
+  }
 
-            if (attempt < 2) {
-              console.log(`⏳ Retrying fetch in 2 seconds...`);
-              await new Promise((resolve) => setTimeout(resolve, 2000));
-            }
-          }
-        }
+  // Sync participants from SimplyCompete, falling back to the stealth browser (bypasses Cloudflare like Python cloudscraper)
+  app.post("/api/competitions/:id/sync-participants", async (req, res) => {
+    try {
+      const competitionId = parseInt(req.params.id);
 
-        await browser.close();
+      if (isNaN(competitionId)) {
+        return res.status(400).json({ error: "Invalid competition ID" });
+      }
 
-        // If both attempts failed, throw the error
-        if (fetchError || !textContent) {
-          throw (
-            fetchError ||
-            new Error("Failed to fetch participants after 2 attempts")
-          );
-        }
+      // Get the competition from the database
+      const competition = await storage.getCompetition(competitionId);
+      if (!competition) {
+        return res.status(404).json({ error: "Competition not found" });
+      }
 
-        const data = JSON.parse(textContent);
+      const simplyCompeteEventId = (competition as any).simplyCompeteEventId;
+      if (!simplyCompeteEventId) {
+        return res.status(400).json({
+          error: "This competition doesn't have a SimplyCompete event ID",
+        });
+      }
 
-        if (
-          !data.data?.data?.participantList ||
-          !Array.isArray(data.data.data.participantList)
-        ) {
-          throw new Error("Invalid response format from SimplyCompete");
-        }
+      // Try a plain HTTP request first; it avoids launching Chromium whenever
+      // Cloudflare lets the server-side request through. A block is not retried,
+      // since the stealth browser below is the fallback for it.
+      let { participants } = await fetchAthleteParticipants(
+        simplyCompeteEventId,
+        false,
+      );
 
-        const participants = data.data.data.participantList;
+      if (participants.length > 0) {
         console.log(
-          `✅ Successfully fetched ${participants.length} participants using stealth browser`,
+          `✅ Fetched ${participants.length} participants without the stealth browser`,
         );
+      } else {
+        participants =
+          await fetchParticipantsWithStealthBrowser(simplyCompeteEventId);
+      }
 
-        // Process participants and sync to database in parallel batches
-        let synced = 0;
-        let updated = 0;
-        let matched = 0;
-        let created = 0;
-        const errors: string[] = [];
+      // Process participants and sync to database in parallel batches
+      let synced = 0;
+      let updated = 0;
+      let matched = 0;
+      let created = 0;
+      const errors: string[] = [];
+
+      // Process in batches of 20 for optimal performance
+      const BATCH_SIZE = 20;
+      console.log(
+        `🔄 Processing ${participants.length} participants in batches of ${BATCH_SIZE}...`,
+      );
 
-        // Process in batches of 20 for optimal performance
-        const BATCH_SIZE = 20;
+      for (let i = 0; i < participants.length; i += BATCH_SIZE) {
+        const batch = participants.slice(i, i + BATCH_SIZE);
         console.log(
-          `🔄 Processing ${participants.length} participants in batches of ${BATCH_SIZE}...`,
+          `📦 Processing batch ${Math.floor(i / BATCH_SIZE) + 1}/${Math.ceil(participants.length / BATCH_SIZE)} (${batch.length} participants)...`,
         );
 
-        for (let i = 0; i < participants.length; i += BATCH_SIZE) {
-          const batch = participants.slice(i, i + BATCH_SIZE);
-          console.log(
-            `📦 Processing batch ${Math.floor(i / BATCH_SIZE) + 1}/${Math.ceil(participants.length / BATCH_SIZE)} (${batch.length} participants)...`,
-          );
+        await Promise.all(
+          batch.map(async (participant: any) => {
+            try {
+              const fullName =
+                `${participant.preferredFirstName || ""} ${participant.preferredLastName || ""}`.trim();
+              const country = participant.country || "";
+              const weightCategory = participant.divisionName || null;
+              const clubName =
+                participant.clubName || participant.customClubName || null;
+              const teamOrganizationName =
+                participant.teamOrganizationName || null;
+              const subeventName = participant.subeventName || null;
+              const teamName = participant.teamName || null;
+              const avatar = participant.avatar || "";
+              const userId = participant.userId || "";
+
+              if (!fullName) return;
+
+              // Try to find athlete by SimplyCompete userId first (most accurate)
+              let existingAthletes: any[] = [];
 
-          await Promise.all(
-            batch.map(async (participant: any) => {
-              try {
-                const fullName =
-                  `${participant.preferredFirstName || ""} ${participant.preferredLastName || ""}`.trim();
-                const country = participant.country || "";
-                const weightCategory = participant.divisionName || null;
-                const clubName =
-                  participant.clubName || participant.customClubName || null;
-                const teamOrganizationName =
-                  participant.teamOrganizationName || null;
-                const subeventName = participant.subeventName || null;
-                const teamName = participant.teamName || null;
-                const avatar = participant.avatar || "";
-                const userId = participant.userId || "";
-
-                if (!fullName) return;
-
-                // Try to find athlete by SimplyCompete userId first (most accurate)
-                let existingAthletes: any[] = [];
-
-                if (userId) {
-                  existingAthletes = await db
-                    .select()
-                    .from(schema.athletes)
-                    .where(eq(schema.athletes.simplyCompeteUserId, userId))
-                    .limit(1);
-
-                  if (existingAthletes.length > 0) {
+              if (userId) {
+                existingAthletes = await db
+                  .select()
+                  .from(schema.athletes)
+                  .where(eq(schema.athletes.simplyCompeteUserId, userId))
+                  .limit(1);
+
+                if (existingAthletes.length > 0) {
+                  console.log(
+                    `✓ Matched athlete by SimplyCompete userId: ${fullName} (userId: ${userId})`,
+                  );
+                }
+              }
+
+              // If no match by userId, try to find athlete by name and nationality
+              if (existingAthletes.length === 0) {
+                existingAthletes = await db
+                  .select()
+                  .from(schema.athletes)
+                  .where(
+                    and(
+                      eq(schema.athletes.name, fullName),
+                      eq(schema.athletes.nationality, country),
+                    ),
+                  )
+                  .limit(1);
+
+                if (existingAthletes.length > 0) {
+                  console.log(
+                    `✓ Matched athlete by name and nationality: ${fullName} (${country})`,
+                  );
+
+                  // Update the athlete with the SimplyCompete userId and other fields for future matching
+                  const updateData: any = {};
+                  if (userId) updateData.simplyCompeteUserId = userId;
+                  if (clubName) updateData.clubName = clubName;
+                  if (teamOrganizationName)
+                    updateData.teamOrganizationName = teamOrganizationName;
+                  if (teamName) updateData.teamName = teamName;
+
+                  if (Object.keys(updateData).length > 0) {
+                    await db
+                      .update(schema.athletes)
+                      .set(updateData)
+                      .where(eq(schema.athletes.id, existingAthletes[0].id));
                     console.log(
-                      `✓ Matched athlete by SimplyCompete userId: ${fullName} (userId: ${userId})`,
+                      `  ↳ Updated athlete with: ${Object.keys(updateData).join(", ")}`,
                     );
                   }
                 }
+              }
 
-                // If no match by userId, try to find athlete by name and nationality
-                if (existingAthletes.length === 0) {
-                  existingAthletes = await db
-                    .select()
-                    .from(schema.athletes)
-                    .where(
-                      and(
-                        eq(schema.athletes.name, fullName),
-                        eq(schema.athletes.nationality, country),
-                      ),
-                    )
-                    .limit(1);
+              let athleteId: number;
 
-                  if (existingAthletes.length > 0) {
-                    console.log(
-                      `✓ Matched athlete by name and nationality: ${fullName} (${country})`,
-                    );
+              if (existingAthletes.length > 0) {
+                athleteId = existingAthletes[0].id;
+                matched++;
+                console.log(
+                  `✓ Matched existing athlete: ${fullName} (ID: ${athleteId})`,
+                );
+              } else {
+                // Create new athlete with all available data (like JSON import process)
+                const insertAthlete: any = {
+                  name: fullName,
+                  sport: "Taekwondo",
+                  nationality: country || "Unknown",
+                  worldCategory: weightCategory || null,
+                  gender: weightCategory?.startsWith("M-")
+                    ? "Male"
+                    : weightCategory?.startsWith("F-")
+                      ? "Female"
+                      : null,
+                  profileImage: null, // Never store external URLs directly - will be set after upload
+                  simplyCompeteUserId: userId || null, // Store SimplyCompete user ID for matching
+                  clubName,
+                  teamOrganizationName,
+                  teamName,
+                };
+
+                const [newAthlete] = await db
+                  .insert(schema.athletes)
+                  .values(insertAthlete)
+                  .returning();
+
+                athleteId = newAthlete.id;
+                created++;
+                console.log(
+                  `✨ Created new athlete: ${fullName} (ID: ${athleteId}, Country: ${country}, Category: ${weightCategory})`,
+                );
 
-                    // Update the athlete with the SimplyCompete userId and other fields for future matching
-                    const updateData: any = {};
-                    if (userId) updateData.simplyCompeteUserId = userId;
-                    if (clubName) updateData.clubName = clubName;
-                    if (teamOrganizationName)
-                      updateData.teamOrganizationName = teamOrganizationName;
-                    if (teamName) updateData.teamName = teamName;
+                // Handle profile image upload if avatar is available
+                if (avatar && avatar !== "N/A" && avatar.trim() !== "") {
+                  console.log(
+                    `📸 Queuing image upload for ${fullName} from: ${avatar.substring(0, 50)}...`,
+                  );
+
+                  // Upload image in background (don't await to avoid blocking)
+                  (async () => {
+                    try {
+                      const { bucketStorage: storage } = await import(
+                        "./bucket-storage"
+                      );
+                      console.log(`📤 Uploading image for ${fullName}...`);
+
+                      const imageResult = await storage.uploadFromUrl(
+                        athleteId,
+                        avatar,
+                      );
 
-                    if (Object.keys(updateData).length > 0) {
                       await db
                         .update(schema.athletes)
-                        .set(updateData)
-                        .where(eq(schema.athletes.id, existingAthletes[0].id));
+                        .set({ profileImage: imageResult.url })
+                        .where(eq(schema.athletes.id, athleteId));
+
                       console.log(
-                        `  ↳ Updated athlete with: ${Object.keys(updateData).join(", ")}`,
+                        `✅ Successfully uploaded and saved profile image for ${fullName} (ID: ${athleteId})`,
+                      );
+                    } catch (imageError: any) {
+                      console.error(
+                        `❌ Failed to upload profile image for ${fullName} (ID: ${athleteId}):`,
+                        imageError.message,
                       );
                     }
-                  }
-                }
-
-                let athleteId: number;
-
-                if (existingAthletes.length > 0) {
-                  athleteId = existingAthletes[0].id;
-                  matched++;
-                  console.log(
-                    `✓ Matched existing athlete: ${fullName} (ID: ${athleteId})`,
-                  );
+                  })();
                 } else {
-                  // Create new athlete with all available data (like JSON import process)
-                  const insertAthlete: any = {
-                    name: fullName,
-                    sport: "Taekwondo",
-                    nationality: country || "Unknown",
-                    worldCategory: weightCategory || null,
-                    gender: weightCategory?.startsWith("M-")
-                      ? "Male"
-                      : weightCategory?.startsWith("F-")
-                        ? "Female"
-                        : null,
-                    profileImage: null, // Never store external URLs directly - will be set after upload
-                    simplyCompeteUserId: userId || null, // Store SimplyCompete user ID for matching
-                    clubName,
-                    teamOrganizationName,
-                    teamName,
-                  };
-
-                  const [newAthlete] = await db
-                    .insert(schema.athletes)
-                    .values(insertAthlete)
-                    .returning();
-
-                  athleteId = newAthlete.id;
-                  created++;
-                  console.log(
-                    `✨ Created new athlete: ${fullName} (ID: ${athleteId}, Country: ${country}, Category: ${weightCategory})`,
-                  );
-
-                  // Handle profile image upload if avatar is available
-                  if (avatar && avatar !== "N/A" && avatar.trim() !== "") {
-                    console.log(
-                      `📸 Queuing image upload for ${fullName} from: ${avatar.substring(0, 50)}...`,
-                    );
-
-                    // Upload image in background (don't await to avoid blocking)
-                    (async () => {
-                      try {
-                        const { bucketStorage: storage } = await import(
-                          "./bucket-storage"
-                        );
-                        console.log(`📤 Uploading image for ${fullName}...`);
-
-                        const imageResult = await storage.uploadFromUrl(
-                          athleteId,
-                          avatar,
-                        );
-
-                        await db
-                          .update(schema.athletes)
-                          .set({ profileImage: imageResult.url })
-                          .where(eq(schema.athletes.id, athleteId));
-
-                        console.log(
-                          `✅ Successfully uploaded and saved profile image for ${fullName} (ID: ${athleteId})`,
-                        );
-                      } catch (imageError: any) {
-                        console.error(
-                          `❌ Failed to upload profile image for ${fullName} (ID: ${athleteId}):`,
-                          imageError.message,
-                        );
-                      }
-                    })();
-                  } else {
-                    console.log(`ℹ️ No avatar available for ${fullName}`);
-                  }
+                  console.log(`ℹ️ No avatar available for ${fullName}`);
                 }
+              }
 
-                // Check if already linked to competition
-                const existing = await db
-                  .select()
-                  .from(schema.competitionParticipants)
+              // Check if already linked to competition
+              const existing = await db
+                .select()
+                .from(schema.competitionParticipants)
+                .where(
+                  and(
+                    eq(
+                      schema.competitionParticipants.competitionId,
+                      competitionId,
+                    ),
+                    eq(schema.competitionParticipants.athleteId, athleteId),
+                  ),
+                )
+                .limit(1);
+
+              if (existing.length === 0) {
+                await db.insert(schema.competitionParticipants).values({
+                  competitionId,
+                  athleteId,
+                  weightCategory,
+                  subeventName,
+                });
+                synced++;
+              } else {
+                // Update existing participant record with latest data
+                await db
+                  .update(schema.competitionParticipants)
+                  .set({
+                    weightCategory,
+                    subeventName,
+                  })
                   .where(
                     and(
                       eq(
@@ -2617,65 +2817,34 @@ export async function registerRoutes(app: Express): Promise<Server> {
                       ),
                       eq(schema.competitionParticipants.athleteId, athleteId),
                     ),
-                  )
-                  .limit(1);
-
-                if (existing.length === 0) {
-                  await db.insert(schema.competitionParticipants).values({
-                    competitionId,
-                    athleteId,
-                    weightCategory,
-                    subeventName,
-                  });
-                  synced++;
-                } else {
-                  // Update existing participant record with latest data
-                  await db
-                    .update(schema.competitionParticipants)
-                    .set({
-                      weightCategory,
-                      subeventName,
-                    })
-                    .where(
-                      and(
-                        eq(
-                          schema.competitionParticipants.competitionId,
-                          competitionId,
-                        ),
-                        eq(schema.competitionParticipants.athleteId, athleteId),
-                      ),
-                    );
-                  updated++;
-                }
-              } catch (error: any) {
-                errors.push(
-                  `Failed to process ${participant.preferredFirstName} ${participant.preferredLastName}: ${error.message}`,
-                );
+                  );
+                updated++;
               }
-            }),
-          );
-        }
-
-        console.log(
-          `✅ Sync complete: ${synced} new, ${updated} updated, ${matched} matched, ${created} created`,
+            } catch (error: any) {
+              errors.push(
+                `Failed to process ${participant.preferredFirstName} ${participant.preferredLastName}: ${error.message}`,
+              );
+            }
+          }),
         );
-
-        res.json({
-          success: true,
-          stats: {
-            total: participants.length,
-            synced,
-            updated,
-            matched,
-            created,
-            errors: errors.length,
-          },
-          errors: errors.slice(0, 10), // Return first 10 errors only
-        });
-      } catch (error: any) {
-        await browser.close();
-        throw error;
       }
+
+      console.log(
+        `✅ Sync complete: ${synced} new, ${updated} updated, ${matched} matched, ${created} created`,
+      );
+
+      res.json({
+        success: true,
+        stats: {
+          total: participants.length,
+          synced,
+          updated,
+          matched,
+          created,
+          errors: errors.length,
+        },
+        errors: errors.slice(0, 10), // Return first 10 errors only
+      });
     } catch (error: any) {
       console.error("Error in stealth browser sync:", error);
       res.status(500).json({
@@ -4022,21 +4191,60 @@ export async function registerRoutes(app: Express): Promise<Server> {
     },
   );
 
+  // Cache the upstream competition list for a few minutes so repeated syncs share
+  // one SimplyCompete fetch. The in-flight promise is cached too, so concurrent
+  // requests wait on the same call instead of stampeding the Flask service.
+  const COMPETITION_SYNC_CACHE_TTL_MS = 5 * 60 * 1000;
+  let competitionSyncCache: { data: Promise<any>; expiresAt: number } | null =
+    null;
+
+  function fetchSyncedCompetitions(): { data: Promise<any>; hit: boolean } {
+    const now = Date.now();
+    if (competitionSyncCache && competitionSyncCache.expiresAt > now) {
+      return { data: competitionSyncCache.data, hit: true };
+    }
+
+    // Call the Python Flask service to get competitions
+    const data = fetch("http://localhost:5001/competitions/sync").then(
+      async (flaskResponse) => {
+        if (!flaskResponse.ok) {
+          throw new Error(`Flask service returned ${flaskResponse.status}`);
+        }
+        return flaskResponse.json();
+      },
+    );
+
+    // Jitter the TTL by ±10% so entries don't all expire at the same moment
+    const ttl = COMPETITION_SYNC_CACHE_TTL_MS * (0.9 + Math.random() * 0.2);
+    const entry = { data, expiresAt: now + ttl };
+    competitionSyncCache = entry;
+
+    // Never keep failed or unsuccessful responses around
+    data.then(
+      (flaskData) => {
+        if (!flaskData?.success && competitionSyncCache === entry) {
+          competitionSyncCache = null;
+        }
+      },
+      () => {
+        if (competitionSyncCache === entry) {
+          competitionSyncCache = null;
+        }
+      },
+    );
+
+    return { data, hit: false };
+  }
+
   // Sync competitions from SimplyCompete API
   app.post("/api/competitions/sync", isAuthenticated, async (req, res) => {
     try {
       console.log("🔄 Starting competition sync from SimplyCompete...");
 
-      // Call the Python Flask service to get competitions
-      const flaskResponse = await fetch(
-        "http://localhost:5001/competitions/sync",
-      );
+      const { data, hit } = fetchSyncedCompetitions();
+      res.setHeader("X-Cache", hit ? "HIT" : "MISS");
 
-      if (!flaskResponse.ok) {
-        throw new Error(`Flask service returned ${flaskResponse.status}`);
-      }
-
-      const flaskData = await flaskResponse.json();
+      const flaskData = await data;
 
       if (!flaskData.success || !flaskData.competitions) {
         return res.status(400).json({
@@ -4052,51 +4260,136 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       let saved = 0;
       let updated = 0;
+      let unchanged = 0;
       let errors: string[] = [];
 
-      // Process each competition
+      // Load existing competitions once and index them by SimplyCompete event ID
+      const existingCompetitions = await storage.getAllCompetitions();
+      const existingByEventId = new Map(
+        existingCompetitions
+          .filter((c) => c.simplyCompeteEventId)
+          .map((c) => [c.simplyCompeteEventId!, c] as const),
+      );
+
+      const inserts: schema.InsertCompetition[] = [];
+      const updates: { id: number; data: schema.InsertCompetition }[] = [];
+      const unchangedIds: number[] = [];
+      const seenEventIds = new Set<string>();
+
       for (const comp of competitions) {
-        try {
-          // Map SimplyCompete data to our schema
-          const competitionData = {
-            name: comp.name || "Unnamed Competition",
-            country: "International", // Default, update if available in data
-            startDate:
-              comp.startDate ||
-              comp.start_date ||
-              new Date().toISOString().split("T")[0],
-            endDate: comp.endDate || comp.end_date || null,
-            competitionType: "international",
-            pointsAvailable: "0",
-            status: "upcoming",
-            simplyCompeteEventId: comp.id?.toString() || null, // Save the event ID here!
-            lastSyncedAt: new Date(),
-          };
+        // Map SimplyCompete data to our schema
+        const competitionData = {
+          name: comp.name || "Unnamed Competition",
+          country: "International", // Default, update if available in data
+          startDate:
+            comp.startDate ||
+            comp.start_date ||
+            new Date().toISOString().split("T")[0],
+          endDate: comp.endDate || comp.end_date || null,
+          competitionType: "international",
+          pointsAvailable: "0",
+          status: "upcoming",
+          simplyCompeteEventId: comp.id?.toString() || null, // Save the event ID here!
+          lastSyncedAt: new Date(),
+        };
+
+        // Skip repeated event IDs within the same payload
+        if (competitionData.simplyCompeteEventId) {
+          if (seenEventIds.has(competitionData.simplyCompeteEventId)) {
+            continue;
+          }
+          seenEventIds.add(competitionData.simplyCompeteEventId);
+        }
+
+        const existing = competitionData.simplyCompeteEventId
+          ? existingByEventId.get(competitionData.simplyCompeteEventId)
+          : undefined;
+
+        // Only rewrite competitions whose synced fields actually changed; unchanged
+        // ones just get their lastSyncedAt bumped below
+        if (
+          existing &&
+          existing.name === competitionData.name &&
+          existing.startDate === competitionData.startDate &&
+          (existing.endDate ?? null) === competitionData.endDate
+        ) {
+          unchangedIds.push(existing.id);
+          continue;
+        }
+
+        if (existing) {
+          updates.push({ id: existing.id, data: competitionData });
+        } else {
+          inserts.push(competitionData);
+        }
+      }
 
-          // Check if competition with this event ID already exists
-          const existingCompetitions = await storage.getAllCompetitions();
-          const existing = existingCompetitions.find(
-            (c) =>
-              c.simplyCompeteEventId === competitionData.simplyCompeteEventId,
+      // Write all new competitions in a single multi-row INSERT
+      if (inserts.length > 0) {
+        try {
+          await db.insert(schema.competitions).values(inserts);
+          saved = inserts.length;
+          console.log(`✨ Created ${saved} competitions`);
+        } catch (error: any) {
+          // Fall back to one row at a time so a bad competition only fails itself
+          console.error(
+            `❌ Batch insert of ${inserts.length} competitions failed, retrying one by one:`,
+            error.message,
           );
+          for (const competitionData of inserts) {
+            try {
+              await storage.createCompetition(competitionData);
+              saved++;
+            } catch (rowError: any) {
+              const errorMsg = `Failed to save ${competitionData.name}: ${rowError.message}`;
+              console.error(`❌ ${errorMsg}`);
+              errors.push(errorMsg);
+            }
+          }
+        }
+      }
 
-          if (existing) {
-            // Update existing competition
-            await storage.updateCompetition(existing.id, competitionData);
-            updated++;
-            console.log(
-              `✅ Updated: ${competitionData.name} (Event ID: ${competitionData.simplyCompeteEventId})`,
-            );
-          } else {
-            // Create new competition
-            await storage.createCompetition(competitionData);
-            saved++;
-            console.log(
-              `✨ Created: ${competitionData.name} (Event ID: ${competitionData.simplyCompeteEventId})`,
-            );
+      // Send all updates in one round-trip; neon-http runs a batch as a single transaction
+      if (updates.length > 0) {
+        try {
+          const [first, ...rest] = updates.map(({ id, data }) =>
+            db
+              .update(schema.competitions)
+              .set(data)
+              .where(eq(schema.competitions.id, id)),
+          );
+          await db.batch([first, ...rest]);
+          updated = updates.length;
+          console.log(`✅ Updated ${updated} competitions`);
+        } catch (error: any) {
+          // The batch is one transaction, so nothing was written; retry row by row
+          console.error(
+            `❌ Batch update of ${updates.length} competitions failed, retrying one by one:`,
+            error.message,
+          );
+          for (const { id, data } of updates) {
+            try {
+              await storage.updateCompetition(id, data);
+              updated++;
+            } catch (rowError: any) {
+              const errorMsg = `Failed to save ${data.name}: ${rowError.message}`;
+              console.error(`❌ ${errorMsg}`);
+              errors.push(errorMsg);
+            }
           }
+        }
+      }
+
+      // Mark unchanged competitions as synced in a single UPDATE
+      if (unchangedIds.length > 0) {
+        try {
+          await db
+            .update(schema.competitions)
+            .set({ lastSyncedAt: new Date() })
+            .where(inArray(schema.competitions.id, unchangedIds));
+          unchanged = unchangedIds.length;
         } catch (error: any) {
-          const errorMsg = `Failed to save ${comp.name}: ${error.message}`;
+          const errorMsg = `Failed to update last sync time for ${unchangedIds.length} unchanged competitions: ${error.message}`;
           console.error(`❌ ${errorMsg}`);
           errors.push(errorMsg);
         }
@@ -4108,6 +4401,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         totalReceived: competitions.length,
         saved,
         updated,
+        unchanged,
         errors: errors.length > 0 ? errors : undefined,
       });
     } catch (error: any) {
@@ -160,6 +160,7 @@ export const competitions = pgTable("competitions", {
   createdAt: timestamp("created_at").defaultNow(),
 }, (table) => [
   index("simplycompete_id_idx").on(table.simplyCompeteEventId), // Index for faster lookups
+  index("competitions_start_date_name_idx").on(table.startDate, table.name), // Date ordering and name+date matching
 ]);
 
 export const competitionParticipants = pgTable("competition_participants", {